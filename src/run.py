@@ -115,12 +115,14 @@ def parse_args(argv):
     parser.add_argument('--listing_age')
     parser.add_argument('--location')  # Linkedin and Indeed
     parser.add_argument('--limit')
+    parser.add_argument('--spill_dir')  # MyCareersFuture and Linkedin
 
     # MyCareersFuture Specific
     parser.add_argument('--employment_type')
     parser.add_argument('--posting_company')
     parser.add_argument('--sort_by')
     parser.add_argument('--salary')
+    parser.add_argument('--max_memory')  # MB, recycles Chrome above this
 
     # Indeed Specific
     parser.add_argument('--country')
@@ -134,6 +136,7 @@ def parse_args(argv):
 
     args['limit'] = int(args['limit']) if args.get('limit') is not None else None
     args['listing_age'] = int(args['listing_age']) if args.get('listing_age') is not None else None
+    args['max_memory'] = int(args['max_memory']) if args.get('max_memory') is not None else None
     return {k: v for k, v in args.items() if v is not None}
 
 
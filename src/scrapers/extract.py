@@ -0,0 +1,106 @@
+#! <venv>/bin python3.8
+# -*- coding: utf-8 -*-
+"""
+Created on 19/10/26 10:00 am
+
+Declarative field extraction shared by the scrapers.
+
+A spec is a dict mapping a field name to one of:
+    'css selector'              -> text of the first matching element
+    ('css selector', 'attr')    -> attribute of the first matching element
+    [selector, selector, ...]   -> each of the above tried in turn, first match wins
+    None                        -> url of the current page (Selenium only)
+
+Fields whose selector matches nothing come back as None.
+
+@author: David Wong
+"""
+import json
+
+_JS_TEMPLATE = '''
+var spec = %s;
+var root = arguments[0] || document;
+var res = {};
+for (var field in spec) {
+    var sel = spec[field];
+    if (sel === null) {
+        res[field] = window.location.href;
+        continue;
+    }
+    res[field] = null;
+    for (var i = 0; i < sel.length; i++) {
+        var el = root.querySelector(sel[i][0]);
+        if (el === null) {
+            continue;
+        }
+        res[field] = sel[i][1] === null ? el.innerText.trim() : el.getAttribute(sel[i][1]);
+        break;
+    }
+}
+return res;
+'''
+
+
+def _normalise(spec: dict) -> dict:
+    """
+    Turn every non-None selector into an ordered list of (css, attr) pairs.
+    """
+    def pair(sel):
+        return tuple(sel) if isinstance(sel, tuple) else (sel, None)
+
+    return {
+        k: v if v is None else [pair(e) for e in v] if isinstance(v, list) else [pair(v)]
+        for k, v in spec.items()
+    }
+
+
+def compile_script(spec: dict) -> str:
+    """
+    Build a single JavaScript snippet that extracts every field in the spec.
+    :param spec: dict
+        Field to selector mapping
+    :return: str
+        Script to be passed to driver.execute_script
+    """
+    return _JS_TEMPLATE % json.dumps(_normalise(spec))
+
+
+def from_driver(driver, script: str, element=None) -> dict:
+    """
+    Run a compiled spec against the page in one WebDriver round-trip.
+    :param driver:
+        Selenium WebDriver
+    :param script: str
+        Output of compile_script
+    :param element:
+        Optional WebElement to scope the selectors to
+    :return: dict
+    """
+    return driver.execute_script(script, element)
+
+
+def from_soup(soup, spec: dict) -> dict:
+    """
+    Run a spec against an already parsed BeautifulSoup tree.
+    :param soup:
+        BeautifulSoup document or Tag to scope the selectors to
+    :param spec: dict
+        Field to selector mapping
+    :return: dict
+    """
+    res = {}
+    for field, sel in _normalise(spec).items():
+        if sel is None:
+            res[field] = None
+            continue
+
+        res[field] = None
+        for css, attr in sel:
+            el = soup.select_one(css)
+            if el is None:
+                continue
+
+            res[field] = el.get_text() if attr is None else el.get(attr)
+            break
+
+    return res
@@ -0,0 +1,138 @@
+#! <venv>/bin python3.8
+# -*- coding: utf-8 -*-
+"""
+Created on 19/10/26 2:00 pm
+
+Keeps long scraping runs inside a fixed memory budget.
+
+Tracks the memory used by the container (or, outside one, the PSS of this
+process plus chromedriver and Chrome), tells the caller when its browser
+should be recycled and spills accumulated results to disk so the in-memory
+list stays small.
+
+@author: David Wong
+"""
+import json
+import logging
+import os
+import tempfile
+
+import psutil
+
+# cgroup v2, then cgroup v1
+CGROUP_MEMORY_FILES = (
+    '/sys/fs/cgroup/memory.current',
+    '/sys/fs/cgroup/memory/memory.usage_in_bytes',
+)
+
+
+class Governor:
+    def __init__(self,
+                 max_memory: int = 1536,
+                 recycle_every: int = 500,
+                 spill_every: int = 200,
+                 spill_dir: str = None):
+        """
+        :param max_memory: int
+            Memory in MB above which the browser should be recycled.
+            Default leaves headroom under a 2 GB container limit.
+        :param recycle_every: int
+            Recycle the browser after this many jobs regardless of memory
+        :param spill_every: int
+            Spill results to disk once this many are held in memory
+        :param spill_dir: str
+            Directory for the spill file. Defaults to the system temp directory.
+            Each run gets its own file, which is removed by collect and left in place if the run fails.
+        """
+        self._max_memory = max_memory
+        self._recycle_every = recycle_every
+        self._spill_every = spill_every
+        self._spill_dir = spill_dir
+
+        self._process = psutil.Process(os.getpid())
+        self._since_recycle = 0
+        self._spill_path = None
+
+    @classmethod
+    def from_kwargs(cls, kwargs: dict):
+        """
+        Build a Governor from scraper kwargs, passing through only the options that were set.
+        """
+        return cls(**{k: kwargs[k] for k in ('max_memory', 'spill_dir') if kwargs.get(k) is not None})
+
+    def memory(self) -> float:
+        """
+        :return: float
+            Memory charged to the container in MB. Outside a cgroup, falls back to the summed
+            PSS of this process and its descendants so pages shared by Chrome processes count once.
+        """
+        for path in CGROUP_MEMORY_FILES:
+            try:
+                with open(path) as f:
+                    return int(f.read()) / 1024 ** 2
+            except (OSError, ValueError):
+                pass
+
+        total = 0
+        for process in [self._process] + self._process.children(recursive=True):
+            try:
+                total += process.memory_full_info().pss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        return total / 1024 ** 2
+
+    def tick(self, lst: list):
+        """
+        Record one scraped job and spill lst to disk once it holds spill_every jobs.
+        lst is cleared in place after spilling.
+        """
+        self._since_recycle += 1
+
+        if len(lst) >= self._spill_every:
+            self.spill(lst)
+
+    def needs_recycle(self) -> bool:
+        if self._since_recycle >= self._recycle_every:
+            return True
+
+        memory = self.memory()
+        if memory > self._max_memory:
+            logging.info(f'Memory at {memory:.0f} MB exceeds {self._max_memory} MB')
+            return True
+
+        return False
+
+    def recycled(self):
+        self._since_recycle = 0
+
+    def spill(self, lst: list):
+        if self._spill_path is None:
+            # mkstemp creates the file with 0600 permissions
+            fd, self._spill_path = tempfile.mkstemp(prefix='job_scraper_', suffix='.jsonl', dir=self._spill_dir)
+            os.close(fd)
+
+        with open(self._spill_path, 'a') as f:
+            for e in lst:
+                f.write(json.dumps(e, default=str) + '\n')
+
+        logging.info(f'Spilled {len(lst)} jobs to {self._spill_path}')
+        lst.clear()
+
+    def collect(self, lst: list) -> list:
+        """
+        Read back everything spilled during this run, followed by lst, and remove the spill file.
+        Spilled values that are not JSON types (e.g. dates) come back as strings.
+        :return: list
+        """
+        if self._spill_path is None:
+            return lst
+
+        with open(self._spill_path) as f:
+            res = [json.loads(line) for line in f]
+
+        os.remove(self._spill_path)
+        self._spill_path = None
+
+        res.extend(lst)
+        return res
@@ -17,6 +17,18 @@ import urllib
 
 import pendulum
 
+from scrapers import extract
+
+JOB_CARD_SPEC = {
+    'title': 'a.jobtitle',
+    'address': ['div.location', 'span.location'],
+    'company': 'span.company',
+    'summary': 'div.summary',
+    'url': ('h2 a', 'href'),
+    'date': 'span.date.date-a11y',
+    'salary': 'span.salary',
+}
+
 
 class Scraper:
     """JobsScraper is a simple job postings scraper for Indeed."""
@@ -72,7 +84,7 @@ class Scraper:
 
     @staticmethod
     def _clean_text(txt):
-        return txt.text.strip().replace('\n', '')
+        return txt.strip().replace('\n', '')
 
     @classmethod
     def _clean_date(cls, txt):
@@ -103,15 +115,7 @@ class Scraper:
 
         for job in jobs:
 
-            job = {
-                'title': job.find('a', class_='jobtitle'),
-                'address': job.find('div', class_='location') or job.find('span', class_='location'),
-                'company': job.find('span', class_='company'),
-                'summary': job.find('div', {'class': 'summary'}),
-                'url': job.h2.a.get('href'),
-                'date': job.find('span', class_='date date-a11y'),
-                'salary': job.find('span', class_='salary'),
-            }
+            job = extract.from_soup(job, JOB_CARD_SPEC)
 
             try:
                 job.update({k: trans_f[k](v) for k, v in job.items() if v is not None})
@@ -11,6 +11,8 @@ from linkedin_jobs_scraper.events import Events, EventData
 from linkedin_jobs_scraper.query import Query, QueryOptions, QueryFilters
 from linkedin_jobs_scraper.filters import RelevanceFilters, TimeFilters, TypeFilters, ExperienceLevelFilters
 
+from scrapers.governor import Governor
+
 chromedriver = '/usr/local/bin/chromedriver'
 
 # Change root logger level (default is WARN)
@@ -18,6 +20,7 @@ logging.basicConfig(level=logging.WARN)
 logging.getLogger('li:scraper').setLevel(logging.INFO)
 
 jobs = []
+governor = None
 
 
 def on_data(data: EventData):
@@ -30,6 +33,7 @@ def on_data(data: EventData):
     }
 
     jobs.append(dct)
+    governor.tick(jobs)
 
 
 def on_error(error):
@@ -87,10 +91,13 @@ def scrape(query: str,
             Singapore
     :param limit: integer
         Max Number of Jobs to Fetch
+    :param kwargs:
+        spill_dir is passed on to Governor, which spills results to disk.
+        linkedin_jobs_scraper owns its Chrome driver, so it is not recycled and max_memory is not enforced here.
     :return:
     """
 
-    global jobs
+    global jobs, governor
 
     experience_filters = {
         'internship': ExperienceLevelFilters.INTERNSHIP,
@@ -124,6 +131,7 @@ def scrape(query: str,
     experience_filter = [experience_filters[e] for e in experience] if experience else None
 
     jobs = []
+    governor = Governor.from_kwargs(kwargs)
     queries = [
         Query(
             query=query,
@@ -141,6 +149,8 @@ def scrape(query: str,
         )
     ]
     scraper.run(queries)
+
+    jobs = governor.collect(jobs)
     [e.update({'query': query}) for e in jobs]
 
     return jobs
@@ -10,6 +10,7 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 
 from tqdm import tqdm
 
@@ -17,10 +18,27 @@ import urllib
 import pendulum
 import logging
 
+from scrapers import extract
+from scrapers.governor import Governor
+
+JOB_SPEC = {
+    'title': '#job_title',
+    'company': "p[data-cy='company-hire-info__company']",
+    'date': '#last_posted_date',
+    'link': None,
+    'description': '#job_description',
+    'experience': '#seniority',
+    'address': '#address',
+    'employment_type': '#employment_type',
+    'job_category': '#job-categories',
+    'salary': "span[class='salary_range dib f2-5 fw6 black-80']",
+}
+
 
 class Scraper:
     def __init__(self):
         self.driver = self.init_chromedriver()
+        self._job_script = extract.compile_script(JOB_SPEC)
 
     def scrape(self,
                query: str,
@@ -43,6 +61,8 @@ class Scraper:
             integer or None
         :param listing_age:
             integer or None
+        :param kwargs:
+            max_memory and spill_dir are passed on to Governor
         :return:
         """
 
@@ -58,6 +78,7 @@ class Scraper:
         posted_after = pendulum.today().subtract(days=listing_age) if listing_age else None
 
         lst = []
+        self._governor = Governor.from_kwargs(kwargs)
 
         url = 'https://www.mycareersfuture.gov.sg/search?{}'.format(urllib.parse.urlencode(payload))
 
@@ -90,52 +111,74 @@ class Scraper:
 
                 WebDriverWait(self.driver, 20).until(EC.presence_of_element_located((By.ID, 'job_description')))
 
-                post_date = pendulum.parse(self.driver.find_element_by_id('last_posted_date').text.replace('Posted ', ''),
-                                           strict=False)
+                dct = extract.from_driver(self.driver, self._job_script)
+
+                post_date = pendulum.parse(dct['date'].replace('Posted ', ''), strict=False)
                 if posted_after is not None and post_date < posted_after:
                     logging.info(f'Post Date: {post_date} is earlier than Posted After {posted_after}. Ending Loop')
                     continue_running = False
                     break
 
-                salary = self.driver.find_element_by_xpath("//span[@class='salary_range dib f2-5 fw6 black-80']")\
-                    .text.replace('$', '').replace(',', '').split('to')
+                salary = dct.pop('salary')
 
-                min_salary, max_salary = salary if len(salary) == 2 else (None, salary)
-                if type(max_salary) == list and max_salary[0] == 'salary undisclosed':
-                    max_salary = None
+                if salary is None:
+                    min_salary, max_salary = None, None
+                else:
+                    salary = salary.replace('$', '').replace(',', '').split('to')
+                    min_salary, max_salary = salary if len(salary) == 2 else (None, salary)
+                    if type(max_salary) == list and max_salary[0] == 'salary undisclosed':
+                        max_salary = None
 
-                dct = {
-                    'title': self.driver.find_element_by_id('job_title').text,
-                    'company': self.driver.find_element_by_xpath("//p[@data-cy='company-hire-info__company']").text,
+                dct.update({
                     'date': post_date,
-                    'link': self.driver.current_url,
-                    'description': self.driver.find_element_by_id('job_description').text,
-                    'experience': self.driver.find_element_by_id('seniority').text,
-                    'address': self.driver.find_element_by_id('address').text,
-                    'employment_type': self.driver.find_element_by_id('employment_type').text,
-                    'job_category': self.driver.find_element_by_id('job-categories').text,
                     'min_salary': min_salary,
                     'max_salary': max_salary
-                }
+                })
 
                 lst.append(dct)
+                self._governor.tick(lst)
                 pbar.update(1)
                 self.driver.back()
 
             try:
                 WebDriverWait(self.driver, 20).until(EC.presence_of_element_located((By.ID, 'job-card-0')))
+                page_url = self.driver.current_url
                 self.driver.find_element_by_xpath("//span[@data-cy='pagination__next']").click()
             except Exception as e:
                 logging.info('No more pages. Ending loop.')
                 break
 
+            if continue_running and self._governor.needs_recycle():
+                self._recycle_driver(page_url)
+
         pbar.close()
         self.driver.close()
 
+        lst = self._governor.collect(lst)
         [e.update({'query': query}) for e in lst]
 
         return lst
 
+    def _recycle_driver(self, prev_url: str):
+        """
+        Replace the browser with a fresh one at the current results page, dropping its history and heap.
+        :param prev_url:
+            Url of the results page before pagination, used to wait for the next page's url
+        """
+        try:
+            WebDriverWait(self.driver, 20).until(EC.url_changes(prev_url))
+        except TimeoutException:
+            logging.warning(f'Url did not change from {prev_url} after pagination. Skipping recycle.')
+            return
+
+        url = self.driver.current_url
+        logging.info(f'Recycling Chrome at {url}')
+
+        self.driver.quit()
+        self.driver = self.init_chromedriver()
+        self.driver.get(url)
+        self._governor.recycled()
+
     @staticmethod
     def init_chromedriver(chrome_executable_path='/usr/local/bin/chromedriver',
                           width=1472,